@@ -3,6 +3,7 @@
 """Some handy base class and special purpose Activity types."""
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, override
 
 import babase
@@ -14,30 +15,84 @@ from bascenev1._player import EmptyPlayer
 from bascenev1._team import EmptyTeam
 from bascenev1._music import MusicType, setmusic
 
+# Bind the functions we call during activity transitions so each call is
+# a single global lookup instead of a module attribute lookup. (Note
+# that babase.app is intentionally *not* bound here.)
+_apptime = babase.apptime
+_fade_screen = babase.fade_screen
+_lock_all_input = babase.lock_all_input
+_unlock_all_input = babase.unlock_all_input
+_set_analytics_screen = babase.set_analytics_screen
+_new_host_session = _bascenev1.new_host_session
+_timer = _bascenev1.timer
 
 if TYPE_CHECKING:
     import bascenev1
     from bascenev1._lobby import JoinInfo
+    from bascenev1lib.actor.background import Background
+    from bascenev1lib.actor.tipstext import TipsText
+    from bascenev1lib.actor.text import Text
+
+# These live in bascenev1lib which imports us, so we can't pull them in
+# at module load. They get filled in once by _ensure_imports().
+_Background: type[Background]
+_TipsText: type[TipsText]
+_Text: type[Text]
+_g_imports_done = False  # pylint: disable=invalid-name
+
+
+def _ensure_imports() -> None:
+    """Resolve our deferred bascenev1lib imports (once)."""
+    # pylint: disable=global-statement
+    # pylint: disable=cyclic-import
+    global _Background, _TipsText, _Text, _g_imports_done
+    if _g_imports_done:
+        return
+    from bascenev1lib.actor.background import Background
+    from bascenev1lib.actor.tipstext import TipsText
+    from bascenev1lib.actor.text import Text
+
+    _Background = Background
+    _TipsText = TipsText
+    _Text = Text
+    _g_imports_done = True
+
+
+# Press-any-button Lstrs by ui-scale; these never change so we only
+# build each once.
+_press_any_button_lstrs: dict[babase.UIScale, babase.Lstr] = {}
+
+
+def _get_press_any_button_lstr(uiscale: babase.UIScale) -> babase.Lstr:
+    sval = _press_any_button_lstrs.get(uiscale)
+    if sval is None:
+        if uiscale is babase.UIScale.LARGE:
+            # FIXME: Need a better way to determine whether we've probably
+            #  got a keyboard.
+            sval = babase.Lstr(resource='pressAnyKeyButtonText')
+        else:
+            sval = babase.Lstr(resource='pressAnyButtonText')
+        _press_any_button_lstrs[uiscale] = sval
+    return sval
 
 
 class EndSessionActivity(Activity[EmptyPlayer, EmptyTeam]):
     """Special Activity to fade out and end the current Session."""
 
-    def __init__(self, settings: dict):
-        super().__init__(settings)
+    __slots__ = ()
 
-        # Keeps prev activity alive while we fade out.
-        self.transition_time = 0.25
-        self.inherits_tint = True
-        self.inherits_slow_motion = True
-        self.inherits_vr_camera_offset = True
-        self.inherits_vr_overlay_center = True
+    # Keeps prev activity alive while we fade out.
+    transition_time = 0.25
+    inherits_tint = True
+    inherits_slow_motion = True
+    inherits_vr_camera_offset = True
+    inherits_vr_overlay_center = True
 
     @override
     def on_transition_in(self) -> None:
         super().on_transition_in()
-        babase.fade_screen(False)
-        babase.lock_all_input()
+        _fade_screen(False)
+        _lock_all_input()
 
     @override
     def on_begin(self) -> None:
@@ -48,10 +103,10 @@ class EndSessionActivity(Activity[EmptyPlayer, EmptyTeam]):
         main_menu_session = babase.app.classic.get_main_menu_session()
 
         super().on_begin()
-        babase.unlock_all_input()
+        _unlock_all_input()
         assert babase.app.classic is not None
         babase.app.classic.ads.call_after_ad(
-            babase.Call(_bascenev1.new_host_session, main_menu_session)
+            partial(_new_host_session, main_menu_session)
         )
 
 
@@ -61,37 +116,35 @@ class JoinActivity(Activity[EmptyPlayer, EmptyTeam]):
     It shows tips and other info and waits for all players to check ready.
     """
 
-    def __init__(self, settings: dict):
-        super().__init__(settings)
+    __slots__ = ('_background', '_tips_text', '_join_info')
 
-        # This activity is a special 'joiner' activity.
-        # It will get shut down as soon as all players have checked ready.
-        self.is_joining_activity = True
+    # This activity is a special 'joiner' activity.
+    # It will get shut down as soon as all players have checked ready.
+    is_joining_activity = True
 
-        # Players may be idle waiting for joiners; lets not kick them for it.
-        self.allow_kick_idle_players = False
+    # Players may be idle waiting for joiners; lets not kick them for it.
+    allow_kick_idle_players = False
 
-        # In vr mode we don't want stuff moving around.
-        self.use_fixed_vr_overlay = True
+    # In vr mode we don't want stuff moving around.
+    use_fixed_vr_overlay = True
 
+    def __init__(self, settings: dict):
+        super().__init__(settings)
         self._background: bascenev1.Actor | None = None
         self._tips_text: bascenev1.Actor | None = None
         self._join_info: JoinInfo | None = None
+        _ensure_imports()
 
     @override
     def on_transition_in(self) -> None:
-        # pylint: disable=cyclic-import
-        from bascenev1lib.actor.tipstext import TipsText
-        from bascenev1lib.actor.background import Background
-
         super().on_transition_in()
-        self._background = Background(
+        self._background = _Background(
             fade_time=0.5, start_faded=True, show_logo=True
         )
-        self._tips_text = TipsText()
+        self._tips_text = _TipsText()
         setmusic(MusicType.CHAR_SELECT)
         self._join_info = self.session.lobby.create_join_info()
-        babase.set_analytics_screen('Joining Screen')
+        _set_analytics_screen('Joining Screen')
 
 
 class TransitionActivity(Activity[EmptyPlayer, EmptyTeam]):
@@ -100,6 +153,8 @@ class TransitionActivity(Activity[EmptyPlayer, EmptyTeam]):
     Useful as a bare minimum transition between two level based activities.
     """
 
+    __slots__ = ('_background',)
+
     # Keep prev activity alive while we fade in.
     transition_time = 0.5
     inherits_slow_motion = True  # Don't change.
@@ -111,14 +166,12 @@ class TransitionActivity(Activity[EmptyPlayer, EmptyTeam]):
     def __init__(self, settings: dict):
         super().__init__(settings)
         self._background: bascenev1.Actor | None = None
+        _ensure_imports()
 
     @override
     def on_transition_in(self) -> None:
-        # pylint: disable=cyclic-import
-        from bascenev1lib.actor.background import Background
-
         super().on_transition_in()
-        self._background = Background(
+        self._background = _Background(
             fade_time=0.5, start_faded=False, show_logo=False
         )
 
@@ -127,7 +180,7 @@ class TransitionActivity(Activity[EmptyPlayer, EmptyTeam]):
         super().on_begin()
 
         # Die almost immediately.
-        _bascenev1.timer(0.1, self.end)
+        _timer(0.1, self.end)
 
 
 class ScoreScreenActivity(Activity[EmptyPlayer, EmptyTeam]):
@@ -136,6 +189,22 @@ class ScoreScreenActivity(Activity[EmptyPlayer, EmptyTeam]):
     After a specified delay, player input is assigned to end the activity.
     """
 
+    # Note: Activity itself has a __dict__, so subclasses remain free to
+    # add their own attributes; these just skip the dict for our own.
+    __slots__ = (
+        '_birth_time',
+        '_min_view_time',
+        '_assign_deadline',
+        '_background',
+        '_tips_text',
+        '_kicked_off_server_shutdown',
+        '_kicked_off_server_restart',
+        '_default_show_tips',
+        '_custom_continue_message',
+        '_server_transitioning',
+        '_safe_assign_weak',
+    )
+
     transition_time = 0.5
     inherits_tint = True
     inherits_vr_camera_offset = True
@@ -143,11 +212,23 @@ class ScoreScreenActivity(Activity[EmptyPlayer, EmptyTeam]):
 
     default_music: MusicType | None = MusicType.SCORES
 
+    # Subclasses that make good 'end points' can enable this to give
+    # server-mode a chance to switch sessions/etc. when a player presses.
+    _allow_server_transition = False
+
+    # Inputs that will end us once our min-view-time has passed.
+    _PLAYER_PRESS_INPUTS = (
+        babase.InputType.JUMP_PRESS,
+        babase.InputType.PUNCH_PRESS,
+        babase.InputType.BOMB_PRESS,
+        babase.InputType.PICK_UP_PRESS,
+    )
+
     def __init__(self, settings: dict):
         super().__init__(settings)
-        self._birth_time = babase.apptime()
+        self._birth_time = _apptime()
         self._min_view_time = 5.0
-        self._allow_server_transition = False
+        self._assign_deadline = 0.0  # Calced in on_transition_in().
         self._background: bascenev1.Actor | None = None
         self._tips_text: bascenev1.Actor | None = None
         self._kicked_off_server_shutdown = False
@@ -156,80 +237,79 @@ class ScoreScreenActivity(Activity[EmptyPlayer, EmptyTeam]):
         self._custom_continue_message: babase.Lstr | None = None
         self._server_transitioning: bool | None = None
 
+        # Extra args passed to a WeakCall get appended to its own, so we
+        # can share this single one across all player-join timers.
+        self._safe_assign_weak = babase.WeakCall(self._safe_assign)
+        _ensure_imports()
+
     @override
     def on_player_join(self, player: EmptyPlayer) -> None:
         super().on_player_join(player)
-        time_till_assign = max(
-            0, self._birth_time + self._min_view_time - babase.apptime()
-        )
+        time_till_assign = max(0.0, self._assign_deadline - _apptime())
 
-        # If we're still kicking at the end of our assign-delay, assign this
-        # guy's input to trigger us.
-        _bascenev1.timer(
-            time_till_assign, babase.WeakCall(self._safe_assign, player)
-        )
+        # If our assign-delay has already passed, assign this guy's input
+        # to trigger us right away; otherwise do so at the end of it if
+        # we're still kicking.
+        if time_till_assign <= 0.0:
+            self._safe_assign(player)
+        else:
+            _timer(time_till_assign, partial(self._safe_assign_weak, player))
 
     @override
     def on_transition_in(self) -> None:
-        from bascenev1lib.actor.tipstext import TipsText
-        from bascenev1lib.actor.background import Background
-
         super().on_transition_in()
-        self._background = Background(
+
+        # Calc this here instead of in our constructor so subclasses get
+        # a chance to tweak _min_view_time. Players can't join us until
+        # we've transitioned in so it is always ready in time.
+        self._assign_deadline = self._birth_time + self._min_view_time
+
+        self._background = _Background(
             fade_time=0.5, start_faded=False, show_logo=True
         )
         if self._default_show_tips:
-            self._tips_text = TipsText()
+            self._tips_text = _TipsText()
         setmusic(self.default_music)
 
     @override
     def on_begin(self) -> None:
-        # pylint: disable=cyclic-import
-        from bascenev1lib.actor.text import Text
-
         super().on_begin()
 
         # Pop up a 'press any button to continue' statement after our
         # min-view-time show a 'press any button to continue..'
         # thing after a bit.
         assert babase.app.classic is not None
-        if babase.app.ui_v1.uiscale is babase.UIScale.LARGE:
-            # FIXME: Need a better way to determine whether we've probably
-            #  got a keyboard.
-            sval = babase.Lstr(resource='pressAnyKeyButtonText')
-        else:
-            sval = babase.Lstr(resource='pressAnyButtonText')
-
-        Text(
-            (
-                self._custom_continue_message
-                if self._custom_continue_message is not None
-                else sval
-            ),
-            v_attach=Text.VAttach.BOTTOM,
-            h_align=Text.HAlign.CENTER,
+        sval = self._custom_continue_message
+        if sval is None:
+            sval = _get_press_any_button_lstr(babase.app.ui_v1.uiscale)
+
+        _Text(
+            sval,
+            v_attach=_Text.VAttach.BOTTOM,
+            h_align=_Text.HAlign.CENTER,
             flash=True,
             vr_depth=50,
             position=(0, 10),
             scale=0.8,
             color=(0.5, 0.7, 0.5, 0.5),
-            transition=Text.Transition.IN_BOTTOM_SLOW,
+            transition=_Text.Transition.IN_BOTTOM_SLOW,
             transition_delay=self._min_view_time,
         ).autoretain()
 
     def _player_press(self) -> None:
+        # Fast path for the common (non-server-mode) case.
+        if not self._allow_server_transition:
+            self.end()
+            return
+
         # If this activity is a good 'end point', ask server-mode just once if
         # it wants to do anything special like switch sessions or kill the app.
-        if (
-            self._allow_server_transition
-            and babase.app.classic is not None
-            and babase.app.classic.server is not None
-            and self._server_transitioning is None
-        ):
-            self._server_transitioning = (
-                babase.app.classic.server.handle_transition()
-            )
-            assert isinstance(self._server_transitioning, bool)
+        if self._server_transitioning is None:
+            classic = babase.app.classic
+            server = classic.server if classic is not None else None
+            if server is not None:
+                self._server_transitioning = server.handle_transition()
+                assert isinstance(self._server_transitioning, bool)
 
         # If server-mode is handling this, don't do anything ourself.
         if self._server_transitioning is True:
@@ -242,12 +322,4 @@ class ScoreScreenActivity(Activity[EmptyPlayer, EmptyTeam]):
         # Just to be extra careful, don't assign if we're transitioning out.
         # (though theoretically that should be ok).
         if not self.is_transitioning_out() and player:
-            player.assigninput(
-                (
-                    babase.InputType.JUMP_PRESS,
-                    babase.InputType.PUNCH_PRESS,
-                    babase.InputType.BOMB_PRESS,
-                    babase.InputType.PICK_UP_PRESS,
-                ),
-                self._player_press,
-            )
+            player.assigninput(self._PLAYER_PRESS_INPUTS, self._player_press)